@@ -16,7 +16,7 @@ Functions:
 
 from importlib import reload
 from pf_config import pft
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from devices import fuse_mapping as fm
 import pf_protection_helper as helper
@@ -53,16 +53,26 @@ def get_all_fuses(app: pft.Application) -> List[pft.RelFuse]:
     """
     net_mod = app.GetProjectFolder("netmod")
     all_fuses = net_mod.GetContents("*.RelFuse", True)
-    fuses = [
-        fuse
-        for fuse in all_fuses
-        if fuse.cpGrid
-        if fuse.cpGrid.IsCalcRelevant()
-        if fuse.fold_id.HasAttribute("cterm")
-        if fuse.fold_id.cterm.IsEnergized()
-        if not fuse.IsOutOfService()
-        if determine_fuse_type(fuse)
-    ]
+    # Many fuses share a secondary substation, so its transformer check
+    # is shared across this scan
+    sub_has_tr = {}
+    # Explicit loop so each PowerFactory attribute is fetched once;
+    # the line/transformer classification is the costliest test and
+    # runs last
+    fuses = []
+    for fuse in all_fuses:
+        grid = fuse.cpGrid
+        if not grid or not grid.IsCalcRelevant():
+            continue
+        cubicle = fuse.fold_id
+        if not cubicle.HasAttribute("cterm"):
+            continue
+        if not cubicle.cterm.IsEnergized():
+            continue
+        if fuse.IsOutOfService():
+            continue
+        if determine_fuse_type(fuse, sub_has_tr):
+            fuses.append(fuse)
     return fuses
 
 
@@ -266,7 +276,10 @@ def f_types(app: pft.Application, recursive: int):
     return fuse_types
 
 
-def determine_fuse_type(fuse: pft.RelFuse) -> bool:
+def determine_fuse_type(
+        fuse: pft.RelFuse,
+        sub_has_tr: Optional[Dict] = None
+) -> bool:
     """
     Determine if a fuse is a line fuse (not a transformer fuse).
 
@@ -276,12 +289,15 @@ def determine_fuse_type(fuse: pft.RelFuse) -> bool:
 
     Classification logic:
     1. If fuse is in System Overview terminal → line fuse
-    2. If fuse is in a line cubicle → line fuse
-    3. If fuse name is not in its parent switch object → line fuse
+    2. If fuse name is not in its parent switch object → line fuse
+    3. If fuse is in a line cubicle → line fuse
     4. If fuse's secondary substation contains a transformer → TR fuse
 
     Args:
         fuse: PowerFactory RelFuse object.
+        sub_has_tr: Optional cache of secondary substation objects to
+            whether they contain an ElmTr2, shared between calls so
+            each substation's contents are scanned only once.
 
     Returns:
         True if the fuse is a line fuse (to be included).
@@ -297,24 +313,22 @@ def determine_fuse_type(fuse: pft.RelFuse) -> bool:
     if not fuse_active:
         return True
 
-    fuse_grid = fuse.cpGrid
-    # Check if fuse is in a line cubicle (System Overview)
-    if (
-            fuse.GetAttribute("r:fold_id:r:cterm:r:fold_id:e:loc_name")
-            == fuse_grid.loc_name
-    ):
-        # This would indicate it is in a line cubical
-        return True
-
     # Check if fuse is in a switch object
     if fuse.loc_name not in fuse.GetAttribute("r:fold_id:r:obj_id:e:loc_name"):
         return True
 
-    # Check if secondary substation contains a transformer
+    # Check if fuse is in a line cubicle (System Overview)
     secondary_sub = fuse.fold_id.cterm.fold_id
-    contents = secondary_sub.GetContents()
-    for content in contents:
-        if content.GetClassName() == "ElmTr2":
-            return False
-    else:
-        return True
\ No newline at end of file
+    if secondary_sub.loc_name == fuse.cpGrid.loc_name:
+        # This would indicate it is in a line cubical
+        return True
+
+    # Check if secondary substation contains a transformer
+    if sub_has_tr is None:
+        sub_has_tr = {}
+    if secondary_sub not in sub_has_tr:
+        sub_has_tr[secondary_sub] = any(
+            content.GetClassName() == "ElmTr2"
+            for content in secondary_sub.GetContents()
+        )
+    return not sub_has_tr[secondary_sub]
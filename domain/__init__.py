@@ -47,6 +47,7 @@ from domain.enums import (
     ElementType,
     ConstructionType,
     FaultType,
+    GRID_FAULT_LEVEL_ATTRS,
     ph_attr_lookup,
 )
 
@@ -75,6 +76,7 @@ __all__ = [
     "ElementType",
     "ConstructionType",
     "FaultType",
+    "GRID_FAULT_LEVEL_ATTRS",
     "ph_attr_lookup",
     # Domain models
     "Feeder",
@@ -37,6 +37,19 @@ class FaultType(Enum):
     PHASE_GROUND = "Phase-Ground"
 
 
+# =============================================================================
+# ATTRIBUTE NAMES
+# =============================================================================
+
+# External grid (ElmXnet) fault level attributes: five maximum then five
+# minimum. Each grid's data list holds these values in this order,
+# followed by the five system normal minimum values.
+GRID_FAULT_LEVEL_ATTRS = (
+    'ikss', 'rntxn', 'z2tz1', 'x0tx1', 'r0tx0',
+    'ikssmin', 'rntxnmin', 'z2tz1min', 'x0tx1min', 'r0tx0min'
+)
+
+
 # =============================================================================
 # LOOKUP FUNCTIONS
 # =============================================================================
@@ -70,4 +83,4 @@ def ph_attr_lookup(phtech: int) -> Optional[int]:
     for phases, attr_set in _PHASE_MAPPING.items():
         if phtech in attr_set:
             return phases
-    return None
\ No newline at end of file
+    return None
@@ -493,6 +493,11 @@ def grid_equivalence_check(new_grid_data: Dict) -> bool:
 
 _original_grid_outserv: Dict = {}
 
+# External grid minimum source impedance attributes, in the order they
+# appear in each grid's data list (positions 5-9 for minimum, 10-14 for
+# system normal minimum).
+_MIN_GRID_ATTRS = dd.GRID_FAULT_LEVEL_ATTRS[5:]
+
 
 def reset_min_source_imp(new_grid_data: Dict,
     sys_norm_min: bool = False
@@ -518,28 +523,20 @@ def reset_min_source_imp(new_grid_data: Dict,
                 # Record current service state before forcing the grid
                 # out of service, so the restore call can return it
                 # exactly rather than re-energising it.
-                _original_grid_outserv[grid] = grid.GetAttribute('outserv')
-                grid.SetAttribute('outserv', 1)
+                _original_grid_outserv[grid] = grid.outserv
+                grid.outserv = 1
             else:
-                grid.SetAttribute('ikssmin', attributes[10])
-                grid.SetAttribute('rntxnmin', attributes[11])
-                grid.SetAttribute('z2tz1min', attributes[12])
-                grid.SetAttribute('x0tx1min', attributes[13])
-                grid.SetAttribute('r0tx0min', attributes[14])
+                for attr, value in zip(_MIN_GRID_ATTRS, attributes[10:15]):
+                    setattr(grid, attr, value)
         else:
-            grid.SetAttribute('ikssmin', attributes[5])
-            grid.SetAttribute('rntxnmin', attributes[6])
-            grid.SetAttribute('z2tz1min', attributes[7])
-            grid.SetAttribute('x0tx1min', attributes[8])
-            grid.SetAttribute('r0tx0min', attributes[9])
+            for attr, value in zip(_MIN_GRID_ATTRS, attributes[5:10]):
+                setattr(grid, attr, value)
 
             # Restore the original service state only for grids this
             # function forced out of service; grids it never touched
             # keep their current state.
             if grid in _original_grid_outserv:
-                grid.SetAttribute(
-                    'outserv', _original_grid_outserv.pop(grid)
-                )
+                grid.outserv = _original_grid_outserv.pop(grid)
 
 
 def copy_min_fls(devices: List[dd.Device]) -> None:
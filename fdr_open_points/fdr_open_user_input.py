@@ -164,20 +164,21 @@ def get_feeders(app: pft.Application, radial_dic: Dict) -> List[str]:
     canvas.pack(side="left", fill="both", expand=True)
     canvas.create_window((4, 4), window=frame, anchor="nw")
 
-    frame.bind(
-        "<Configure>",
-        lambda event, c=canvas: _on_frame_configure(c)
-    )
-
     list_length, var = populate_feeders(app, root, frame, radial_list)
 
+    # The feeder list is static, so the scroll region is set once after
+    # layout rather than on every <Configure> event
+    frame.update_idletasks()
+    _on_frame_configure(canvas)
+
     root.mainloop()
 
-    # Collect selected feeders
-    feeder_list = []
-    for i in range(list_length):
-        if var[i].get() == 1:
-            feeder_list.append(radial_list[i])
+    # Snapshot checkbox states in one sweep, then select in plain Python
+    var_states = [checkbox_var.get() for checkbox_var in var[:list_length]]
+    feeder_list = [
+        feeder for feeder, state in zip(radial_list, var_states)
+        if state == 1
+    ]
 
     # Re-prompt if no feeders selected
     if not feeder_list:
@@ -217,7 +218,7 @@ def _calculate_window_dim(radial_list: List[str]) -> tuple:
 
 def _on_frame_configure(canvas: tk.Canvas) -> None:
     """
-    Update scroll region when frame is resized.
+    Update scroll region to fit the populated frame.
 
     Args:
         canvas: Canvas containing the scrollable frame.
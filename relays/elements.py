@@ -39,14 +39,17 @@ def get_all_relays(app: "pft.Application") -> List["pft.ElmRelay"]:
     net_mod = app.GetProjectFolder("netmod")
     all_relays = net_mod.GetContents("*.ElmRelay", True)
 
-    relays = [
-        relay
-        for relay in all_relays
-        if relay.cpGrid
-        if relay.cpGrid.IsCalcRelevant()
-        if relay.GetParent().GetClassName() == "StaCubic"
-        if not relay.IsOutOfService()
-    ]
+    # Explicit loop so each PowerFactory attribute is fetched once
+    relays = []
+    for relay in all_relays:
+        grid = relay.cpGrid
+        if not grid or not grid.IsCalcRelevant():
+            continue
+        if relay.GetParent().GetClassName() != "StaCubic":
+            continue
+        if relay.IsOutOfService():
+            continue
+        relays.append(relay)
     return relays
 
 
@@ -82,7 +85,7 @@ def get_prot_elements(
     idmt_elements = [
         idmt_element
         for idmt_element in device_pf.GetContents("*.RelToc", True)
-        if not idmt_element.GetAttribute("e:outserv")
+        if not idmt_element.outserv
     ]
 
     # Phase overcurrent IDMT elements (I>t characteristic, not definite time)
@@ -20,6 +20,9 @@ about lines out of service, and validates all user inputs before
 proceeding with fault studies.
 
 Classes:
+    BulkIntVar: IntVar-like view of one checkbox in a shared array.
+    EntryVar: Entry field value held in a plain Tcl global variable.
+    CheckListCanvas: Columns of checkboxes drawn on a single canvas.
     FaultLevelStudy: Main class orchestrating user input collection.
 
 Functions:
@@ -32,19 +35,286 @@ Example:
     ... )
 """
 
-from tkinter import *  # noqa: F403
+import bisect
+import itertools
 import math
 import sys
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from pf_config import pft
-from domain.enums import ElementType
+from domain.enums import ElementType, GRID_FAULT_LEVEL_ATTRS
 from devices import fuses
 from relays import elements
 
 
+# Entry labels for the attributes in GRID_FAULT_LEVEL_ATTRS, in the
+# same order.
+_GRID_LABELS = (
+    "P-P-P fault max.", "R/X max.", "Z2/Z1 max.",
+    "X0/X1 max.", "R0/X0 max.",
+    "P-P-P fault min.", "R/X min.", "Z2/Z1 min.",
+    "X0/X1 min.", "R0/X0 min."
+)
+
+# Values held per grid in the dialog: the GRID_FAULT_LEVEL_ATTRS values
+# followed by the five system normal minimum values.
+_GRID_VALUE_COUNT = 15
+
+# Columns of the dialog grid data holding the maximum, minimum and
+# system normal minimum fault levels (kA).
+_FAULT_LEVEL_COLUMNS = [0, 5, 10]
+
+# Master project grid impedance ratios used for system normal minimum.
+_MASTER_GRID_ATTRS = ('rntxnmin', 'z2tz1min', 'x0tx1min', 'r0tx0min')
+
+# Converts an 11kV fault level in MVA to a fault current in kA.
+_MVA_TO_KA_11KV = 1 / (11 * math.sqrt(3))
+
+# Name tags of lines checked for being out of service, matched anywhere
+# in the line name.
+_OOS_LINE_TAGS = ('HV', 'TR', 'LN')
+
+# Regional model switch name prefixes for reclosers and EDO fuses.
+_ACR_PREFIXES = (
+    '(ACR/SECT/LBS)', '(CIRCUIT RECL)',
+    '(CIRCUIT RECLOSER)', '(OIL CIRCUIT RECL)'
+)
+_EDO_PREFIXES = ('(EDO FUSE)',)
+
+# Height of each drawn checkbox row, including its padding.
+_CHECK_ROW_HEIGHT = 32
+
+# Side length of a drawn checkbox and the gap before its label.
+_CHECK_BOX_SIZE = 14
+_CHECK_TEXT_GAP = 6
+
+# Delay (ms) used to coalesce bursts of <Configure> events into one
+# scroll region update, roughly one display frame.
+_CONFIGURE_DEBOUNCE_MS = 16
+
+# Canvas layout (pixels) for one external grid's entry sections. Text
+# widths and line heights come from the font metrics; these are only
+# the padding and gaps between them.
+_GRID_ROW_PAD = 10
+_GRID_BOX_PAD = 6
+_GRID_LABEL_X = 10
+_GRID_TEXT_GAP = 10
+
+# Width of each grid entry field, in characters of the entry font.
+_GRID_ENTRY_CHARS = 20
+
+# Note shown below values taken from the master project.
+_GRID_MASTER_NOTE = "Default Values Copied From Master Project"
+
+
+class BulkIntVar:
+    """
+    IntVar-like view of one checkbox in a shared state array.
+
+    Reading the value touches only the numpy array, never the Tcl
+    interpreter, so collecting many checkbox states costs no Tcl
+    round-trips.
+
+    Example:
+        >>> state = np.array([0, 1, 0], dtype=np.uint8)
+        >>> BulkIntVar(state, 1).get()
+        1
+    """
+
+    __slots__ = ('_state', '_index')
+
+    def __init__(self, state: np.ndarray, index: int) -> None:
+        """
+        Bind the view to one element of the state array.
+
+        Args:
+            state: Shared checkbox state array.
+            index: Position of this checkbox in the array.
+        """
+        self._state = state
+        self._index = index
+
+    def get(self) -> int:
+        """Return 1 if the checkbox is ticked, otherwise 0."""
+        return int(self._state[self._index])
+
+
+class EntryVar:
+    """
+    Entry field value held in a plain Tcl global variable.
+
+    Lighter than tk.DoubleVar: creating one is a single globalsetvar
+    call and no Variable wrapper object is kept per entry. The Entry
+    widget binds to the variable by name.
+
+    Example:
+        >>> var = EntryVar(canvas.tk, f"{canvas}.entry0", 2.5)
+        >>> entry = tk.Entry(canvas, textvariable=var.name)
+        >>> var.get()
+        2.5
+    """
+
+    __slots__ = ('_interp', 'name')
+
+    def __init__(self, interp: Any, name: str, value: float) -> None:
+        """
+        Create the Tcl variable holding the initial value.
+
+        Args:
+            interp: Tcl interpreter of the dialog (widget.tk).
+            name: Global variable name, unique within the dialog.
+            value: Initial entry value.
+        """
+        self._interp = interp
+        self.name = name
+        interp.globalsetvar(name, value)
+
+    def get(self) -> float:
+        """
+        Return the entry value as a float.
+
+        Parsed by Tcl, as tk.DoubleVar does, so text such as "nan" or
+        "1_0" that Python's float() would accept is rejected.
+
+        Raises:
+            tk.TclError: If the entry text is not a number.
+        """
+        return self._interp.getdouble(self._interp.globalgetvar(self.name))
+
+
+class CheckListCanvas(tk.Canvas):
+    """
+    Columns of checkboxes drawn as items on a single canvas.
+
+    Each checkbox is a rectangle, a tick line and a text item rather
+    than a Checkbutton widget, so thousands of rows cost no per-widget
+    theming or focus handling and scroll as one window. Tick state
+    lives in a numpy array; a click maps its coordinates to a cell and
+    toggles that entry and its tick item.
+
+    Attributes:
+        state: uint8 tick state for each checkbox, column by column.
+        var: BulkIntVar view of each checkbox, aligned with state.
+
+    Example:
+        >>> checks = CheckListCanvas(frame, [['FDR1', 'FDR2']], padx=25)
+        >>> checks.set_all(1)
+        >>> [var.get() for var in checks.var]
+        [1, 1]
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        columns: List[List[str]],
+        headers: Optional[List[str]] = None,
+        padx: int = 10
+    ) -> None:
+        """
+        Draw every checkbox and bind the click handler.
+
+        Args:
+            master: Widget to place the canvas in.
+            columns: Checkbox labels for each column, top to bottom.
+            headers: Optional title drawn above each column.
+            padx: Horizontal padding either side of each column.
+        """
+        font = tkfont.nametofont('TkDefaultFont')
+        self._top = _CHECK_ROW_HEIGHT if headers else 0
+        self._col_x = []
+        self._col_start = []
+        self._col_len = [len(labels) for labels in columns]
+
+        x = 0
+        start = 0
+        for c, labels in enumerate(columns):
+            texts = list(labels) + ([headers[c]] if headers else [])
+            text_width = max((font.measure(t) for t in texts), default=0)
+            self._col_x.append(x)
+            self._col_start.append(start)
+            x += 2 * padx + _CHECK_BOX_SIZE + _CHECK_TEXT_GAP + text_width
+            start += len(labels)
+
+        rows = max(self._col_len, default=0)
+        height = self._top + rows * _CHECK_ROW_HEIGHT
+        super().__init__(
+            master,
+            width=x,
+            height=height,
+            borderwidth=0,
+            highlightthickness=0,
+            background=master.cget('background')
+        )
+
+        self.state = np.zeros(start, dtype=np.uint8)
+        self.var = [BulkIntVar(self.state, i) for i in range(start)]
+        self._ticks = []
+
+        box_offset = (_CHECK_ROW_HEIGHT - _CHECK_BOX_SIZE) // 2
+        for c, labels in enumerate(columns):
+            left = self._col_x[c] + padx
+            if headers:
+                self.create_text(
+                    left, _CHECK_ROW_HEIGHT // 2, text=headers[c],
+                    anchor='w', font=font
+                )
+            for r, text in enumerate(labels):
+                top = self._top + r * _CHECK_ROW_HEIGHT
+                y0 = top + box_offset
+                self.create_rectangle(
+                    left, y0, left + _CHECK_BOX_SIZE, y0 + _CHECK_BOX_SIZE,
+                    outline='grey40', fill='white'
+                )
+                self._ticks.append(self.create_line(
+                    left + 3, y0 + _CHECK_BOX_SIZE // 2,
+                    left + _CHECK_BOX_SIZE // 2 - 1, y0 + _CHECK_BOX_SIZE - 3,
+                    left + _CHECK_BOX_SIZE - 3, y0 + 3,
+                    width=2, state='hidden', tags='tick'
+                ))
+                self.create_text(
+                    left + _CHECK_BOX_SIZE + _CHECK_TEXT_GAP,
+                    top + _CHECK_ROW_HEIGHT // 2,
+                    text=text, anchor='w', font=font
+                )
+
+        self.bind('<Button-1>', self._on_click)
+
+    def set_all(self, value: int) -> None:
+        """
+        Tick or untick every checkbox.
+
+        Args:
+            value: 1 to tick all checkboxes, 0 to untick them.
+        """
+        self.state.fill(value)
+        self.itemconfigure('tick', state='normal' if value else 'hidden')
+
+    def _on_click(self, event: tk.Event) -> None:
+        """
+        Toggle the checkbox under the pointer, if any.
+
+        Args:
+            event: Tk mouse event in canvas coordinates.
+        """
+        if event.y < self._top:
+            return
+        column = bisect.bisect_right(self._col_x, event.x) - 1
+        row = (event.y - self._top) // _CHECK_ROW_HEIGHT
+        if column < 0 or row >= self._col_len[column]:
+            return
+        index = self._col_start[column] + row
+        self.state[index] ^= 1
+        self.itemconfigure(
+            self._ticks[index],
+            state='normal' if self.state[index] else 'hidden'
+        )
+
+
 class FaultLevelStudy:
     """
     Orchestrates user input collection for fault level studies.
@@ -56,6 +326,12 @@ class FaultLevelStudy:
     Attributes:
         app: PowerFactory application instance for model queries
             and output messaging.
+        _master_index: Lazily built map of master project external
+            grid names to grid objects.
+        _xnet_cache: Lazily queried list of the model's external grid
+            objects, shared by every dialog step.
+        _feeder_elms: Map of feeder names to their ElmFeeder objects,
+            filled as feeders are resolved.
 
     Example:
         >>> study = FaultLevelStudy(app)
@@ -72,6 +348,9 @@ class FaultLevelStudy:
             app: PowerFactory application instance.
         """
         self.app = app
+        self._master_index = None
+        self._xnet_cache = None
+        self._feeder_elms = {}
 
     def main(
         self, region: str, study_selections: List[str]
@@ -141,6 +420,52 @@ class FaultLevelStudy:
         y = (screen_height - height) // 2
         root.geometry(f"{width}x{height}+{x}+{y}")
 
+    def _xnets(self) -> List:
+        """
+        Return the model's external grids, querying them only once.
+
+        Returns:
+            List of calculation relevant ElmXnet objects.
+        """
+        if self._xnet_cache is None:
+            self._xnet_cache = self.app.GetCalcRelevantObjects('*.ElmXnet')
+        return self._xnet_cache
+
+    def _active_xnets(self) -> List:
+        """
+        Return the external grids that are currently in service.
+
+        Service state is read on every call so changes made after the
+        grids were first queried are respected.
+
+        Returns:
+            List of in-service ElmXnet objects.
+        """
+        return [grid for grid in self._xnets() if grid.outserv == 0]
+
+    def _feeder_elm(self, feeder: str) -> pft.ElmFeeder:
+        """
+        Return the ElmFeeder object for a feeder name.
+
+        Feeders seen by mesh_feeder_check are already known; any other
+        name is looked up in the model once and remembered. Where
+        feeders share a name, the first calculation relevant one is
+        returned.
+
+        Args:
+            feeder: Feeder loc_name.
+
+        Returns:
+            The matching calculation relevant ElmFeeder object.
+        """
+        feeder_elm = self._feeder_elms.get(feeder)
+        if feeder_elm is None:
+            feeder_elm = self.app.GetCalcRelevantObjects(
+                feeder + ".ElmFeeder"
+            )[0]
+            self._feeder_elms[feeder] = feeder_elm
+        return feeder_elm
+
     def mesh_feeder_check(self) -> Tuple[List[str], bool]:
         """
         Filter feeders to exclude mesh configurations.
@@ -156,22 +481,28 @@ class FaultLevelStudy:
                 - mesh_feeder_check: True if any lines are out of service.
         """
         self.app.PrintPlain("Checking for radial feeders...")
-        grids = [
-                grid for grid in self.app.GetCalcRelevantObjects('*.ElmXnet')
-                if grid.outserv == 0
-            ]
+        grids = self._active_xnets()
+        model_feeders = self.app.GetCalcRelevantObjects('*.ElmFeeder')
         all_feeders = [
-            fdr for fdr in self.app.GetCalcRelevantObjects('*.ElmFeeder')
-                       if fdr.GetAll()
-                       and not fdr.IsOutOfService()
+            fdr for fdr in model_feeders
+            if fdr.GetAll() and not fdr.IsOutOfService()
         ]
-
+        # Names are not unique; keep the first calculation relevant
+        # feeder of each name, as a GetCalcRelevantObjects(name)[0]
+        # lookup would, whether or not it passes the filter above
+        for feeder in model_feeders:
+            self._feeder_elms.setdefault(feeder.loc_name, feeder)
+
+        # Built once; the upstream trace only runs when the downstream
+        # trace has already reached a grid.
+        grids_set = frozenset(grids)
         radial_list = []
         mesh_list = []
         for feeder in all_feeders:
+            cubicle = feeder.obj_id
             if (
-                set(feeder.obj_id.GetAll(1, 0)) & set(grids)
-                and set(feeder.obj_id.GetAll(0, 0)) & set(grids)
+                not grids_set.isdisjoint(cubicle.GetAll(1, 0))
+                and not grids_set.isdisjoint(cubicle.GetAll(0, 0))
             ):
                 mesh_list.append(feeder)
             else:
@@ -189,12 +520,13 @@ class FaultLevelStudy:
                 "The following feeders were identified as meshed (indicating that an external grid is in service.\n"
                 "both upstream and downstream of the feeder cubicle):"
             )
-            for feeder in mesh_list:
+            oos_map = {
+                feeder: self.get_lines_oos(feeder) for feeder in mesh_list
+            }
+            for feeder, lines_oos in oos_map.items():
                 self.app.PrintWarn(f"{feeder.loc_name}")
-                if self.get_lines_oos(feeder):
-                    str_lines = [line.loc_name for line in self.get_lines_oos(
-                        feeder
-                    )]
+                if lines_oos:
+                    str_lines = [line.loc_name for line in lines_oos]
                     self.app.PrintWarn(
                         f"{feeder.loc_name} has the following lines out of service:\n"
                         f"{str_lines} \n"
@@ -220,18 +552,17 @@ class FaultLevelStudy:
             feeder. Empty list if none found.
         """
         oos_lines = []
-        line_prefixes = ["HV", "TR", "LN"]
 
         for grid in self.app.GetSummaryGrid().GetContents():
-            oos_lines += [
-                line
-                for line in grid.obj_id.GetContents("*.ElmLne")
-                if any(
-                    string in line.GetAttribute("loc_name")
-                    for string in line_prefixes
-                )
-                if line.IsOutOfService()
-            ]
+            for line in grid.obj_id.GetContents("*.ElmLne"):
+                # The tags may appear anywhere in the name, so this is a
+                # substring match; loc_name is read once per line
+                name = line.loc_name
+                if (
+                    any(tag in name for tag in _OOS_LINE_TAGS)
+                    and line.IsOutOfService()
+                ):
+                    oos_lines.append(line)
 
         fdr_lines_oos = []
         for line in oos_lines:
@@ -290,7 +621,7 @@ class FaultLevelStudy:
 
         Creates a scrollable dialog with feeder checkboxes and external
         grid parameter entry fields. Validates all inputs before
-        returning.
+        returning, keeping the dialog open until they are valid.
 
         Args:
             radial_list: List of available radial feeder names.
@@ -299,27 +630,82 @@ class FaultLevelStudy:
         Returns:
             Tuple containing:
                 - feeder_list: List of user-selected feeder names.
-                - new_grid_data: Dict mapping grid objects to lists of
+                - external_grid: Dict mapping grid objects to lists of
                   validated fault level parameters.
         """
+        # Query the model before the dialog exists so the window is never
+        # left unresponsive while PowerFactory data is collected.
+        grids = [
+            grid for grid in self._active_xnets()
+            if grid.bus1 is not None
+        ]
+        grid_data = self.get_grid_data(grids)
+        self.app.PrintPlain("Please enter the requested inputs.")
+
+        root, error_label, var, grid_entries = self._build_window(
+            radial_list, mesh_feeders, grids, grid_data
+        )
+
+        # Okay only leaves the event loop, so invalid input is reported
+        # in the same window without rebuilding any of its widgets.
+        while True:
+            root.mainloop()
+            error_code, feeder_list, external_grid = (
+                self._validate_and_commit(
+                    radial_list, var, grids, grid_entries
+                )
+            )
+            if error_code is None:
+                break
+            self.window_error(error_label, error_code)
+
+        root.destroy()
+
+        return feeder_list, external_grid
+
+    def _build_window(
+        self,
+        radial_list: List[str],
+        mesh_feeders: bool,
+        grids: List,
+        grid_data: List[List[float]]
+    ) -> Tuple[tk.Tk, ttk.Label, List[BulkIntVar], List[List[EntryVar]]]:
+        """
+        Build the feeder selection and external grid data window.
+
+        The Okay button and window close only leave the event loop, so
+        the window can be shown again after a failed validation.
+
+        Args:
+            radial_list: List of available radial feeder names.
+            mesh_feeders: Flag indicating if mesh feeders were found.
+            grids: List of active external grid objects.
+            grid_data: Current parameter values, a list per grid in
+                the same order as ``grids``.
+
+        Returns:
+            Tuple containing:
+                - root: The dialog's root window.
+                - error_label: Label for displaying input errors.
+                - var: List of BulkIntVar feeder checkbox states.
+                - grid_entries: Entry field variables, a list per grid
+                  in the same order as ``grids``.
+        """
         root = tk.Tk()
+        # Keep the window hidden while it is populated so the partial
+        # layout is never drawn
+        root.withdraw()
 
-        def _window_dim():
-            grids = [
-                grid for grid in self.app.GetCalcRelevantObjects('*.ElmXnet')
-                if grid.outserv == 0
-            ]
-            grid_cols = len(grids)
+        def _window_width(grid_cols):
             column_width = 360
             feeder_col = 285
             window_width = max((grid_cols * column_width + feeder_col), 700)
             if window_width > 1300:
                 window_width = 1500
-            window_height = 600
-            return window_width, window_height
+            return window_width
 
-        window_width, window_height = _window_dim()
-        self.center_window(root, window_width, window_height)
+        # The window is sized and centred once, after it is populated
+        window_width = _window_width(len(grids))
         root.title("Distribution Fault Study")
 
         main_frame = tk.Frame(root)
@@ -330,8 +716,9 @@ class FaultLevelStudy:
         button_frame = tk.Frame(root)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
 
-        list_length, var, grid_entries, grids = self.populate_feeders(
-            root, inner_frame, radial_list, button_frame, mesh_feeders
+        var, grid_entries = self.populate_feeders(
+            root, inner_frame, radial_list, grids, grid_data,
+            button_frame, mesh_feeders
         )
 
         # Resize window to fit content
@@ -344,24 +731,61 @@ class FaultLevelStudy:
         screen_h = root.winfo_screenheight()
         final_h = min(desired_h, int(screen_h * 0.90))
         self.center_window(root, window_width, final_h)
+        root.deiconify()
 
-        root.mainloop()
+        error_label = ttk.Label(button_frame, foreground="red")
+        error_label.pack(side=tk.LEFT, padx=5)
+        root.protocol("WM_DELETE_WINDOW", root.quit)
+
+        return root, error_label, var, grid_entries
+
+    def _validate_and_commit(
+        self,
+        radial_list: List[str],
+        var: List[BulkIntVar],
+        grids: List,
+        grid_entries: List[List[EntryVar]]
+    ) -> Tuple[Optional[int], List[str], Dict]:
+        """
+        Validate the dialog inputs and apply them to the external grids.
+
+        Args:
+            radial_list: List of available radial feeder names.
+            var: List of BulkIntVar feeder checkbox states.
+            grids: List of active external grid objects.
+            grid_entries: Entry field variables, a list per grid in
+                the same order as ``grids``.
 
+        Returns:
+            Tuple containing:
+                - error_code: None if all inputs are valid, otherwise
+                  the window_error code describing the problem.
+                - feeder_list: List of user-selected feeder names.
+                - external_grid: Dict mapping grid objects to lists of
+                  validated fault level parameters. Empty on error.
+        """
+        # Snapshot checkbox states in one sweep
+        var_states = [checkbox_var.get() for checkbox_var in var]
         feeder_list = [
-            radial_list[i] for i in range(list_length) if var[i].get() == 1
+            feeder for feeder, state in zip(radial_list, var_states)
+            if state == 1
         ]
         if not feeder_list:
-            return self.window_error(radial_list, 3, mesh_feeders)
+            return 3, feeder_list, {}
 
-        new_grid_data = self.collect_grid_data(
-            grid_entries, radial_list, mesh_feeders
-        )
+        new_grid_data = self.collect_grid_data(grid_entries)
+        if new_grid_data is None:
+            return 2, feeder_list, {}
         if not self.validate_grid_data(new_grid_data):
-            return self.window_error(radial_list, 1, mesh_feeders)
+            return 1, feeder_list, {}
 
         self.update_grid_data(grids, new_grid_data)
 
-        return feeder_list, new_grid_data
+        # Downstream studies key the external grid data by grid object
+        # and index plain lists of floats
+        external_grid = dict(zip(grids, new_grid_data.tolist()))
+
+        return None, feeder_list, external_grid
 
     def setup_scrollable_frame(
         self, parent: tk.Frame
@@ -370,7 +794,9 @@ class FaultLevelStudy:
         Create a scrollable frame within the parent container.
 
         Sets up a canvas with vertical and horizontal scrollbars that
-        dynamically show/hide based on content size.
+        dynamically show/hide based on content size. Resize events are
+        debounced so a burst of child placements triggers a single
+        scroll region update.
 
         Args:
             parent: Parent tkinter frame to contain the scrollable
@@ -385,74 +811,88 @@ class FaultLevelStudy:
         inner_frame = tk.Frame(canvas)
         vsb = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         hsb = tk.Scrollbar(parent, orient="horizontal", command=canvas.xview)
+
         canvas.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
 
         canvas.pack(fill="both", expand=True)
         canvas.create_window((4, 4), window=inner_frame, anchor="nw")
 
-        inner_frame.bind(
-            "<Configure>",
-            lambda event: self.onFrameConfigure(canvas, vsb, hsb)
-        )
-        canvas.bind(
-            "<Configure>",
-            lambda event: self.onCanvasConfigure(canvas, vsb, hsb)
-        )
+        pending = None
+        # (vsb_shown, hsb_shown) last applied; None until first update
+        scrollbar_state = None
+
+        def schedule_configure(event: tk.Event) -> None:
+            nonlocal pending
+            if pending is not None:
+                canvas.after_cancel(pending)
+            pending = canvas.after(_CONFIGURE_DEBOUNCE_MS, run_configure)
+
+        def run_configure() -> None:
+            nonlocal pending, scrollbar_state
+            pending = None
+            scrollbar_state = self.onFrameConfigure(
+                canvas, vsb, hsb, scrollbar_state
+            )
+
+        inner_frame.bind("<Configure>", schedule_configure)
+        canvas.bind("<Configure>", schedule_configure)
 
         return canvas, inner_frame
 
     @staticmethod
     def onFrameConfigure(
-        canvas: tk.Canvas, vsb: tk.Scrollbar, hsb: tk.Scrollbar
-    ) -> None:
+        canvas: tk.Canvas,
+        vsb: tk.Scrollbar,
+        hsb: tk.Scrollbar,
+        state: Optional[Tuple[bool, bool]] = None
+    ) -> Optional[Tuple[bool, bool]]:
         """
         Update scroll region and show/hide scrollbars as needed.
 
-        Called when the inner frame is resized to update the canvas
-        scroll region.
+        Called (debounced) when the inner frame or canvas is resized to
+        update the canvas scroll region.
 
         Args:
             canvas: The canvas widget.
             vsb: Vertical scrollbar widget.
             hsb: Horizontal scrollbar widget.
-        """
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        FaultLevelStudy.update_scrollbars(canvas, vsb, hsb)
-
-    @staticmethod
-    def onCanvasConfigure(
-        canvas: tk.Canvas, vsb: tk.Scrollbar, hsb: tk.Scrollbar
-    ) -> None:
-        """
-        Handle canvas resize events.
-
-        Updates scrollbar visibility when the canvas is resized.
+            state: (vsb_shown, hsb_shown) from the previous update, or
+                None if the scrollbars have not been placed yet.
 
-        Args:
-            canvas: The canvas widget.
-            vsb: Vertical scrollbar widget.
-            hsb: Horizontal scrollbar widget.
+        Returns:
+            The (vsb_shown, hsb_shown) state after this update.
         """
-        FaultLevelStudy.update_scrollbars(canvas, vsb, hsb)
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        return FaultLevelStudy.update_scrollbars(canvas, vsb, hsb, state)
 
     @staticmethod
     def update_scrollbars(
-        canvas: tk.Canvas, vsb: tk.Scrollbar, hsb: tk.Scrollbar
-    ) -> None:
+        canvas: tk.Canvas,
+        vsb: tk.Scrollbar,
+        hsb: tk.Scrollbar,
+        state: Optional[Tuple[bool, bool]] = None
+    ) -> Optional[Tuple[bool, bool]]:
         """
         Show or hide scrollbars based on content size vs canvas size.
 
         Dynamically displays scrollbars only when content exceeds the
-        visible canvas area.
+        visible canvas area. Scrollbars are only packed or forgotten
+        when the shown state differs from ``state``, avoiding further
+        <Configure> events.
 
         Args:
             canvas: The canvas widget.
             vsb: Vertical scrollbar widget.
             hsb: Horizontal scrollbar widget.
+            state: (vsb_shown, hsb_shown) from the previous update, or
+                None if the scrollbars have not been placed yet.
+
+        Returns:
+            The (vsb_shown, hsb_shown) state after this update.
         """
         scrollregion = canvas.cget("scrollregion")
         if not scrollregion:
-            return
+            return state
 
         x1, y1, x2, y2 = map(float, scrollregion.split())
         content_width = x2 - x1
@@ -461,45 +901,56 @@ class FaultLevelStudy:
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
 
-        if content_height > canvas_height:
+        new_state = (
+            content_height > canvas_height, content_width > canvas_width
+        )
+        if new_state == state:
+            return state
+        vsb_shown, hsb_shown = new_state
+
+        if vsb_shown:
             vsb.pack(side="right", fill="y", before=canvas)
         else:
             vsb.pack_forget()
 
-        if content_width > canvas_width:
+        if hsb_shown:
             hsb.pack(side="bottom", fill="x", before=canvas)
         else:
             hsb.pack_forget()
 
-        canvas.pack(fill="both", expand=True)
+        return new_state
 
     def populate_feeders(
         self,
         root: tk.Tk,
         frame: tk.Frame,
         radial_list: List[str],
+        grids: List,
+        grid_data: List[List[float]],
         button_frame: tk.Frame,
         mesh_feeders: bool = False
-    ) -> Tuple[int, List[tk.IntVar], Dict, List]:
+    ) -> Tuple[List[BulkIntVar], List[List[EntryVar]]]:
         """
         Create feeder selection and external grid entry widgets.
 
         Populates the dialog frame with feeder checkboxes and external
-        grid parameter entry fields.
+        grid parameter entry fields. Makes no PowerFactory queries.
 
         Args:
             root: Root tkinter window.
             frame: Frame to contain the widgets.
             radial_list: List of radial feeder names.
+            grids: List of active external grid objects.
+            grid_data: Current parameter values, a list per grid in
+                the same order as ``grids``.
             button_frame: Frame for action buttons.
-            lines_oos: Flag indicating if lines are out of service.
+            mesh_feeders: Flag indicating if mesh feeders were found.
 
         Returns:
             Tuple containing:
-                - list_length: Number of feeders in the list.
-                - var: List of IntVar checkbox variables.
-                - grid_entries: Dict of grid entry field variables.
-                - grids: List of active external grid objects.
+                - var: List of BulkIntVar checkbox states.
+                - grid_entries: Entry field variables, a list per grid
+                  in the same order as ``grids``.
         """
         ttk.Label(
             frame,
@@ -536,14 +987,6 @@ class FaultLevelStudy:
             )
             current_row += 1
 
-        grids = [
-            grid for grid in self.app.GetCalcRelevantObjects('*.ElmXnet')
-            if grid.outserv == 0
-            and grid.GetAttribute('bus1') is not None
-        ]
-        grid_data = self.get_grid_data(grids)
-        self.app.PrintPlain("Please enter the requested inputs.")
-
         feeder_frame = tk.Frame(frame)
         feeder_frame.grid(
             row=current_row, column=0, columnspan=4, sticky="nw", padx=5, pady=5
@@ -558,32 +1001,33 @@ class FaultLevelStudy:
         )
 
         ttk.Button(
-            button_frame, text='Okay', command=root.destroy
+            button_frame, text='Okay', command=root.quit
         ).pack(side=tk.LEFT, padx=5)
         ttk.Button(
             button_frame, text='Exit', command=lambda: self.exit_script(root)
         ).pack(side=tk.LEFT, padx=5)
 
-        return len(radial_list), var, grid_entries, grids
+        return var, grid_entries
 
-    def get_master_grid(self, grid_loc_name: str):
+    def _build_master_index(self) -> Dict[str, Any]:
         """
-        Retrieve master project grid data for system normal minimum.
-
-        Searches the derived base project for matching external grid
-        elements to obtain system normal minimum fault level data.
+        Index the master project external grids by name.
 
-        Args:
-            grid_loc_name: Location name of the grid to find.
+        Walks the derived base project's network data once and maps
+        each external grid's loc_name to its grid object. Where two
+        substations hold grids of the same name, the first one found
+        is kept.
 
         Returns:
-            The master project grid object if found, False otherwise.
+            Dict mapping grid loc_name to master project grid objects.
+            Empty if the active project has no derived base project.
         """
+        master_index = {}
         project = self.app.GetActiveProject()
-        derived_proj = project.GetAttribute('der_baseproject')
+        derived_proj = project.der_baseproject
 
         if derived_proj is None:
-            return False
+            return master_index
 
         net_dat = derived_proj.GetContents("Network Model\\Network Data")
         for network in net_dat:
@@ -591,22 +1035,40 @@ class FaultLevelStudy:
             for elm_net in elm_nets:
                 elm_substats = elm_net.GetContents("*.ElmSubstat")
                 for elm_substat in elm_substats:
-                    grids = elm_substat.GetContents(
-                        f'{grid_loc_name}.ElmXnet', 1
-                    )
-                    if grids:
-                        master_proj_grids = grids[0]
-                        self.app.PrintPlain(
-                            f'Gathered master grid data for {grid_loc_name}.'
-                        )
-                        return master_proj_grids
+                    for grid in elm_substat.GetContents('*.ElmXnet', 1):
+                        master_index.setdefault(grid.loc_name, grid)
+
+        return master_index
+
+    def get_master_grid(self, grid_loc_name: str):
+        """
+        Retrieve master project grid data for system normal minimum.
+
+        Looks up the matching external grid element in the derived
+        base project to obtain system normal minimum fault level data.
+
+        Args:
+            grid_loc_name: Location name of the grid to find.
+
+        Returns:
+            The master project grid object if found, False otherwise.
+        """
+        if self._master_index is None:
+            self._master_index = self._build_master_index()
+
+        master_grid = self._master_index.get(grid_loc_name)
+        if master_grid is not None:
+            self.app.PrintPlain(
+                f'Gathered master grid data for {grid_loc_name}.'
+            )
+            return master_grid
 
         self.app.PrintPlain(
             f'Could not find master grid data for {grid_loc_name}.'
         )
         return False
 
-    def get_grid_data(self, grids: List) -> Dict:
+    def get_grid_data(self, grids: List) -> List[List[float]]:
         """
         Collect fault level parameters from external grid elements.
 
@@ -618,75 +1080,69 @@ class FaultLevelStudy:
             grids: List of external grid (ElmXnet) objects.
 
         Returns:
-            Dict mapping grid objects to lists of 15 fault level
-            parameters: [ikss, rntxn, z2tz1, x0tx1, r0tx0] for max,
-            min, and system normal minimum conditions.
-        """
-        grid_data = {}
-        attributes = [
-            'ikss', 'rntxn', 'z2tz1', 'x0tx1', 'r0tx0',
-            'ikssmin', 'rntxnmin', 'z2tz1min', 'x0tx1min', 'r0tx0min'
-        ]
+            A list per grid, in the same order as ``grids``, of 15
+            fault level parameters: [ikss, rntxn, z2tz1, x0tx1, r0tx0]
+            for max, min, and system normal minimum conditions. Grid
+            names are not unique, so the data is kept by position.
+        """
+        grid_data = []
 
+        # PowerFactory has no bulk attribute read, so use direct
+        # attribute access rather than the GetAttribute wrapper
         for grid in grids:
-            grid_data[grid] = [
-                grid.GetAttribute(attr) for attr in attributes
+            grid_loc_name = grid.loc_name
+            grid_values = [
+                getattr(grid, attr) for attr in GRID_FAULT_LEVEL_ATTRS
             ]
+            grid_data.append(grid_values)
             self.app.PrintPlain(
                 f'Finding System normal source impedance for {grid}...'
             )
-            grid_loc_name = grid.GetAttribute('loc_name')
             master_grid = self.get_master_grid(grid_loc_name)
 
             if master_grid:
-                grid_prw = master_grid.GetAttribute('snssmin')
-                ikssmin = grid_prw / (11 * math.sqrt(3))
-                master_grid_attr = [
-                    'rntxnmin', 'z2tz1min', 'x0tx1min', 'r0tx0min'
-                ]
+                ikssmin = master_grid.snssmin * _MVA_TO_KA_11KV
                 master_grid_imp = [
-                    master_grid.GetAttribute(attr) for attr in master_grid_attr
+                    getattr(master_grid, attr) for attr in _MASTER_GRID_ATTRS
                 ]
-                grid_data[grid].append(ikssmin)
-                grid_data[grid].extend(master_grid_imp)
+                grid_values.append(ikssmin)
+                grid_values.extend(master_grid_imp)
 
-            if len(grid_data[grid]) == 10:
+            if len(grid_values) == 10:
                 self.app.PrintPlain(
                     f'Could not find system normal source impedance '
                     f'for {grid}...'
                 )
-                grid_data[grid].extend([0, 0, 0, 0, 0])
+                grid_values.extend([0, 0, 0, 0, 0])
 
         return grid_data
 
     def create_feeder_checkboxes(
-        self, feeder_frame: tk.Frame, radial_list: List[str]
-    ) -> List[tk.IntVar]:
+        self,
+        feeder_frame: tk.Frame,
+        radial_list: List[str]
+    ) -> List[BulkIntVar]:
         """
-        Create checkbox widgets for feeder selection.
+        Create the checkbox list for feeder selection.
 
         Args:
             feeder_frame: Frame to contain the checkboxes.
             radial_list: List of feeder names to display.
 
         Returns:
-            List of IntVar variables linked to each checkbox.
+            List of BulkIntVar states for each checkbox.
         """
-        var = []
-        for i, feeder in enumerate(radial_list):
-            var.append(tk.IntVar())
-            ttk.Checkbutton(
-                feeder_frame, text=feeder, variable=var[-1]
-            ).grid(row=i, column=0, sticky="w", padx=25, pady=5)
-        return var
+        checks = CheckListCanvas(feeder_frame, [radial_list], padx=25)
+        checks.grid(row=0, column=0, sticky="w")
+        return checks.var
 
     def create_external_grid_interface(
         self,
         frame: tk.Frame,
         grids: List,
-        grid_data: Dict,
+        grid_data: List[List[float]],
         start_row: int = 0
-    ) -> Dict:
+    ) -> List[List[EntryVar]]:
         """
         Create external grid parameter entry interface.
 
@@ -696,12 +1152,13 @@ class FaultLevelStudy:
         Args:
             frame: Parent frame for the interface.
             grids: List of external grid objects.
-            grid_data: Dict of current grid parameter values.
+            grid_data: Current parameter values, a list per grid in
+                the same order as ``grids``.
             start_row: Starting row for grid placement.
 
         Returns:
-            Dict mapping grid objects to lists of entry field
-            variables.
+            Entry field variables, a list per grid in the same order
+            as ``grids``.
         """
         ttk.Label(
             frame,
@@ -715,12 +1172,10 @@ class FaultLevelStudy:
             sticky="nw", padx=5, pady=5
         )
 
-        grid_entries = {}
-        for i, grid in enumerate(grids):
-            grid_entries[grid] = self.create_grid_entries(
-                grid_entries_frame, grid, grid_data[grid], i * 3
-            )
-        return grid_entries
+        return [
+            self.create_grid_entries(grid_entries_frame, grid, data, i)
+            for i, (grid, data) in enumerate(zip(grids, grid_data))
+        ]
 
     def create_grid_entries(
         self,
@@ -728,148 +1183,142 @@ class FaultLevelStudy:
         grid: Any,
         data: List[float],
         column: int
-    ) -> List[tk.DoubleVar]:
+    ) -> List[EntryVar]:
         """
         Create entry fields for a single external grid's parameters.
 
-        Generates three labeled frames (Maximum, Minimum, System Normal
-        Minimum) each containing five parameter entry fields.
+        Draws three boxed sections (Maximum, Minimum, System Normal
+        Minimum) each containing five parameter entry fields onto a
+        single canvas. Labels and borders are canvas items; only the
+        entry fields are real widgets. Column offsets, row heights and
+        the canvas width are measured from the fonts, so the layout
+        follows the system font size and display scaling.
 
         Args:
             grid_frame: Parent frame for the entry fields.
             grid: External grid object.
             data: List of 15 current parameter values.
-            column: Starting column position.
+            column: Column position within the parent frame.
 
         Returns:
-            List of 15 DoubleVar variables for the entry fields.
+            List of 15 EntryVar values for the entry fields.
         """
         grid_entries = []
-        labels = [
-            "P-P-P fault max.", "R/X max.", "Z2/Z1 max.",
-            "X0/X1 max.", "R0/X0 max.",
-            "P-P-P fault min.", "R/X min.", "Z2/Z1 min.",
-            "X0/X1 min.", "R0/X0 min."
+        # (title, labels, values, values copied from master project)
+        sections = [
+            ("Maximum Values", _GRID_LABELS[:5], data[:5], False),
+            ("Minimum Values", _GRID_LABELS[5:], data[5:10], False),
+            (
+                "Sys Norm Minimum Values", _GRID_LABELS[5:], data[10:15],
+                data[10] != 0
+            ),
         ]
 
-        # Maximum values frame
-        max_frame = tk.LabelFrame(
-            grid_frame,
-            text=f"{grid.loc_name} Maximum Values",
-            relief="solid", bd=1, padx=5, pady=5
+        font = tkfont.nametofont('TkDefaultFont')
+        entry_font = tkfont.nametofont('TkTextFont')
+        titles = [f"{grid.loc_name} {section[0]}" for section in sections]
+
+        title_height = font.metrics('linespace') + _GRID_BOX_PAD
+        row_height = max(
+            font.metrics('linespace'), entry_font.metrics('linespace')
+        ) + _GRID_ROW_PAD
+        entry_x = (
+            _GRID_LABEL_X + _GRID_TEXT_GAP
+            + max(font.measure(label) for label in _GRID_LABELS)
         )
-        max_frame.grid(
-            row=0, column=column, columnspan=3, padx=5, pady=5, sticky="ew"
+        entry_width = entry_font.measure('0') * _GRID_ENTRY_CHARS
+        unit_x = entry_x + entry_width + _GRID_TEXT_GAP
+        canvas_width = max(
+            unit_x + font.measure('kA') + _GRID_LABEL_X,
+            max(font.measure(title) for title in titles) + 2 * _GRID_LABEL_X,
+            font.measure(_GRID_MASTER_NOTE) + 2 * _GRID_LABEL_X,
         )
 
-        for i in range(5):
-            label, value = labels[i], data[i]
-            value = round(value, 6)
-            tk.Label(max_frame, text=label).grid(
-                row=i, column=0, pady=2, sticky="w"
-            )
-            var = tk.DoubleVar(value=value)
-            tk.Entry(max_frame, textvariable=var).grid(
-                row=i, column=1, pady=2, padx=(5, 0)
-            )
-            if i == 0:
-                tk.Label(max_frame, text='kA').grid(
-                    row=i, column=2, ipadx=5, pady=2
-                )
-            grid_entries.append(var)
-
-        # Minimum values frame
-        min_frame = tk.LabelFrame(
-            grid_frame,
-            text=f"{grid.loc_name} Minimum Values",
-            relief="solid", bd=1, padx=5, pady=5
-        )
-        min_frame.grid(
-            row=1, column=column, columnspan=3, padx=5, pady=5, sticky="ew"
+        canvas = tk.Canvas(
+            grid_frame, width=canvas_width, highlightthickness=0
         )
 
-        for i in range(5, 10):
-            label, value = labels[i], data[i]
-            value = round(value, 6)
-            tk.Label(min_frame, text=label).grid(
-                row=i - 5, column=0, pady=2, sticky="w"
-            )
-            var = tk.DoubleVar(value=value)
-            tk.Entry(min_frame, textvariable=var).grid(
-                row=i - 5, column=1, pady=2, padx=(5, 0)
-            )
-            if i == 5:
-                tk.Label(min_frame, text='kA').grid(
-                    row=i - 5, column=2, ipadx=5, pady=2
+        top = 0
+        for title, (_, section_labels, values, from_master) in zip(
+            titles, sections
+        ):
+            canvas.create_text(5, top, text=title, anchor="nw", font=font)
+            box_top = top + title_height
+            row_y = box_top + _GRID_BOX_PAD + row_height // 2
+
+            for i, (label, value) in enumerate(zip(section_labels, values)):
+                canvas.create_text(
+                    _GRID_LABEL_X, row_y, text=label, anchor="w", font=font
+                )
+                var = EntryVar(
+                    canvas.tk, f"{canvas}.entry{len(grid_entries)}",
+                    round(value, 6)
                 )
-            grid_entries.append(var)
+                canvas.create_window(
+                    entry_x, row_y,
+                    window=tk.Entry(
+                        canvas, textvariable=var.name, font=entry_font
+                    ),
+                    width=entry_width, anchor="w"
+                )
+                if i == 0:
+                    canvas.create_text(
+                        unit_x, row_y, text='kA', anchor="w", font=font
+                    )
+                grid_entries.append(var)
+                row_y += row_height
 
-        # System normal minimum frame
-        sys_norm_min_frame = tk.LabelFrame(
-            grid_frame,
-            text=f"{grid.loc_name} Sys Norm Minimum Values",
-            relief="solid", bd=1, padx=5, pady=5
-        )
-        sys_norm_min_frame.grid(
-            row=2, column=column, columnspan=3, padx=5, pady=5, sticky="ew"
-        )
+            if from_master:
+                canvas.create_text(
+                    canvas_width // 2, row_y,
+                    text=_GRID_MASTER_NOTE, font=font
+                )
+                row_y += row_height
 
-        for i in range(10, 15):
-            label, value = labels[i - 5], data[i]
-            value = round(value, 6)
-            tk.Label(sys_norm_min_frame, text=label).grid(
-                row=i - 10, column=0, pady=2, sticky="w"
-            )
-            var = tk.DoubleVar(value=value)
-            tk.Entry(sys_norm_min_frame, textvariable=var).grid(
-                row=i - 10, column=1, pady=2, padx=(5, 0)
+            box_bottom = row_y - row_height // 2 + _GRID_BOX_PAD
+            canvas.create_rectangle(
+                1, box_top, canvas_width - 1, box_bottom
             )
-            if i == 10:
-                tk.Label(sys_norm_min_frame, text='kA').grid(
-                    row=i - 10, column=2, ipadx=5, pady=2
-                )
-            grid_entries.append(var)
+            top = box_bottom + _GRID_BOX_PAD
 
-        if data[10] != 0:
-            tk.Label(
-                sys_norm_min_frame,
-                text="Default Values Copied From Master Project"
-            ).grid(row=6, columnspan=3, pady=2)
+        # Place the canvas only once its final height is known, so the
+        # grid frame is laid out a single time
+        canvas.configure(height=top)
+        canvas.grid(row=0, column=column, padx=5, pady=5, sticky="n")
 
         return grid_entries
 
     def collect_grid_data(
-        self,
-        grid_entries: Dict,
-        radial_list: List[str],
-        mesh_feeders: bool
-    ) -> Dict:
+        self, grid_entries: List[List[EntryVar]]
+    ) -> Optional[np.ndarray]:
         """
         Collect values from grid entry fields.
 
-        Reads all entry field values and handles conversion errors
-        by re-prompting the user.
+        Reads all entry field values into one array, a row per grid.
 
         Args:
-            grid_entries: Dict of grid objects to entry field lists.
-            radial_list: List of radial feeder names (for error
-                recovery).
-            mesh_feeders: mesh feeders flag (for error recovery).
+            grid_entries: Entry field variables, a list per grid.
 
         Returns:
-            Dict mapping grid objects to lists of entered values.
+            Array of shape (n_grids, 15) holding the entered values in
+            the order of ``grid_entries``, or None if any entry field
+            does not hold a finite number. Tcl accepts "Inf" and
+            overflowing values such as "1e400", so these are rejected
+            here as non-numerical.
         """
-        new_grid_data = {}
-        for grid in grid_entries:
+        new_grid_data = np.empty(
+            (len(grid_entries), _GRID_VALUE_COUNT), dtype=np.float64
+        )
+        for row, entries in enumerate(grid_entries):
             try:
-                new_grid_data[grid] = [
-                    item.get() for item in grid_entries[grid]
-                ]
-            except Exception:
-                return self.window_error(radial_list, 2, mesh_feeders)
+                new_grid_data[row] = [item.get() for item in entries]
+            except tk.TclError:
+                return None
+        if not np.isfinite(new_grid_data).all():
+            return None
         return new_grid_data
 
-    def validate_grid_data(self, new_grid_data: Dict) -> bool:
+    def validate_grid_data(self, new_grid_data: np.ndarray) -> bool:
         """
         Validate that fault level values are in correct units.
 
@@ -877,19 +1326,17 @@ class FaultLevelStudy:
         verifying they are less than 100.
 
         Args:
-            new_grid_data: Dict of grid parameter values to validate.
+            new_grid_data: Array of grid parameter values to validate,
+                a row per grid.
 
         Returns:
             True if all values are valid, False otherwise.
         """
-        return all(
-            new_grid_data[grid][0] <= 100
-            and new_grid_data[grid][5] <= 100
-            and new_grid_data[grid][10] <= 100
-            for grid in new_grid_data
-        )
+        return bool((new_grid_data[:, _FAULT_LEVEL_COLUMNS] <= 100).all())
 
-    def update_grid_data(self, grids: List, new_grid_data: Dict) -> None:
+    def update_grid_data(
+        self, grids: List, new_grid_data: np.ndarray
+    ) -> None:
         """
         Apply validated grid data back to PowerFactory objects.
 
@@ -898,41 +1345,31 @@ class FaultLevelStudy:
 
         Args:
             grids: List of external grid objects to update.
-            new_grid_data: Dict of validated parameter values.
+            new_grid_data: Array of validated parameter values, a row
+                per grid in the same order as ``grids``.
         """
-        attributes = [
-            'ikss', 'rntxn', 'z2tz1', 'x0tx1', 'r0tx0',
-            'ikssmin', 'rntxnmin', 'z2tz1min', 'x0tx1min', 'r0tx0min'
-        ]
-
-        for grid in grids:
+        for grid, values in zip(grids, new_grid_data.tolist()):
             try:
-                for attr, value in zip(attributes, new_grid_data[grid]):
+                for attr, value in zip(GRID_FAULT_LEVEL_ATTRS, values):
                     setattr(grid, attr, value)
             except AttributeError:
                 pass
             grid.cmax = 1.1
             grid.cmin = 1
 
-    def window_error(
-        self, radial_list: List[str], error_code: int, mesh_feeders: bool
-    ) -> Tuple[List[str], Dict]:
+    def window_error(self, error_label: ttk.Label, error_code: int) -> None:
         """
-        Display error message and re-prompt user for input.
+        Display an input error in the still-open dialog.
 
-        Shows an appropriate error message based on the error code
-        and recursively calls the input dialog.
+        Prints the message for the error code and shows it in the
+        dialog's error label so the user can correct their input.
 
         Args:
-            radial_list: List of radial feeder names.
+            error_label: Dialog label used to display the message.
             error_code: Error type:
                 1 = Fault level in wrong units (A instead of kA)
                 2 = Non-numerical value entered
                 3 = No feeder selected
-            mesh_feeders: mesh_feeders flag.
-
-        Returns:
-            Result of re-prompting feeders_external_grid dialog.
         """
         error_messages = {
             1: "Please enter fault level values in kA, not A",
@@ -940,7 +1377,7 @@ class FaultLevelStudy:
             3: "Please select at least one feeder to continue"
         }
         self.app.PrintPlain(error_messages[error_code])
-        return self.feeders_external_grid(radial_list, mesh_feeders)
+        error_label.configure(text=error_messages[error_code])
 
     def get_feeders_devices(
         self, radial_list: List[str]
@@ -968,26 +1405,35 @@ class FaultLevelStudy:
         feeder_device_dict = {feeder: [] for feeder in radial_list}
         grid_device_dict = {
             grid: []
-            for grid in self.app.GetCalcRelevantObjects('*.ElmXnet')
+            for grid in self._xnets()
             if grid.bus1 is not None
         }
 
+        # Map each feeder's contents back to the feeder once rather than
+        # rescanning every feeder for every device. Earlier feeders win
+        # where contents overlap, as with the previous first-match scan.
+        term_to_feeder = {}
+        for feeder in reversed(radial_list):
+            for term in self._feeder_elm(feeder).GetAll():
+                term_to_feeder[term] = feeder
+
+        # Grid terminals are resolved, and their iUsage reset, only when
+        # a device outside the feeders first reaches them, then reused
+        grid_terms = {}
+
         for device in devices:
-            term = device.cbranch
-            feeder = [
-                feeder for feeder in radial_list
-                if term in self.app.GetCalcRelevantObjects(
-                    feeder + ".ElmFeeder"
-                )[0].GetAll()
-            ]
-            if feeder:
-                feeder_device_dict[feeder[0]].append(device)
+            feeder = term_to_feeder.get(device.cbranch)
+            if feeder is not None:
+                feeder_device_dict[feeder].append(device)
                 continue
 
             for grid in grid_device_dict:
                 try:
-                    grid_term = grid.bus1.cterm
-                    grid_term.SetAttribute("iUsage", 0)
+                    grid_term = grid_terms.get(grid)
+                    if grid_term is None:
+                        grid_term = grid.bus1.cterm
+                        grid_term.SetAttribute("iUsage", 0)
+                        grid_terms[grid] = grid_term
                     if grid_term == device.cn_bus:
                         grid_device_dict[grid].append(device)
                         break
@@ -1028,24 +1474,14 @@ class FaultLevelStudy:
             if switch.on_off == 1
         ]
 
-        acr_prefix = [
-            '(ACR/SECT/LBS)', '(CIRCUIT RECL)',
-            '(CIRCUIT RECLOSER)', '(OIL CIRCUIT RECL)'
-        ]
-        edo_prefix = ['(EDO FUSE)']
-
         if region == 'Regional Models':
             relay_switches = [
                 switch for switch in elm_coups + sta_switches
-                if any(
-                    substring in switch.loc_name for substring in acr_prefix
-                )
+                if switch.loc_name.startswith(_ACR_PREFIXES)
             ]
             line_fuse_switches = [
                 switch for switch in sta_switches
-                if any(
-                    substring in switch.loc_name for substring in edo_prefix
-                )
+                if switch.loc_name.startswith(_EDO_PREFIXES)
             ]
             all_switches = relay_switches + line_fuse_switches
         else:
@@ -1053,9 +1489,7 @@ class FaultLevelStudy:
 
         feeders_switches = {}
         for feeder in feeder_list:
-            feeder_elm = self.app.GetCalcRelevantObjects(
-                feeder + ".ElmFeeder"
-            )[0]
+            feeder_elm = self._feeder_elm(feeder)
             switch_list = [
                 switch for switch in all_switches
                 if (
@@ -1117,12 +1551,12 @@ class FaultLevelStudy:
         region: str,
         button_frame: tk.Frame,
         relays_configured: bool
-    ) -> Tuple[List[tk.IntVar], Dict[str, List[str]]]:
+    ) -> Tuple[List[BulkIntVar], Dict[str, List[str]]]:
         """
         Create device selection checkboxes for each feeder.
 
         Generates a grid of checkboxes organized by feeder columns
-        for user device selection.
+        for user device selection, drawn on a single canvas.
 
         Args:
             frame: Parent frame for the checkboxes.
@@ -1134,7 +1568,7 @@ class FaultLevelStudy:
 
         Returns:
             Tuple containing:
-                - var: List of IntVar checkbox variables.
+                - var: List of BulkIntVar checkbox states.
                 - fdr_sw_locname: Dict mapping feeders to device
                   display names.
         """
@@ -1144,20 +1578,20 @@ class FaultLevelStudy:
                 for feeder, switches in feeders_switches.items()
             }
         else:
-            fdr_sw_locname = {feeder: [] for feeder in feeders_switches}
-            for feeder, switches in feeders_switches.items():
-                for switch in switches:
-                    if switch.GetClassName() == ElementType.FEEDER.value:
-                        cubicle = switch.obj_id
-                    else:
-                        cubicle = switch.fold_id
-                    switch_term = cubicle.cterm.loc_name
-                    display_name = (
-                        switch_term[:-5]
-                        if switch_term.endswith("_Term")
-                        else switch_term
-                    )
-                    fdr_sw_locname[feeder].append(display_name)
+            # The feeder element itself leads each list; its terminal is
+            # reached through obj_id rather than fold_id
+            feeder_class = ElementType.FEEDER.value
+            fdr_sw_locname = {
+                feeder: [
+                    (
+                        switch.obj_id
+                        if switch.GetClassName() == feeder_class
+                        else switch.fold_id
+                    ).cterm.loc_name.removesuffix("_Term")
+                    for switch in switches
+                ]
+                for feeder, switches in feeders_switches.items()
+            }
 
         if relays_configured:
             ttk.Label(
@@ -1172,34 +1606,23 @@ class FaultLevelStudy:
                 font='Helvetica 12 bold'
             ).grid(columnspan=8, padx=5, pady=5)
 
-        for idx, fid in enumerate(feeder_list):
-            ttk.Label(frame, text=fid).grid(
-                row=1, column=idx, sticky='W', padx=10, pady=5
-            )
-
-        var = []
-
-        for feeder, switch_list in fdr_sw_locname.items():
-            col = list(fdr_sw_locname).index(feeder)
-            for i, switch in enumerate(switch_list):
-                var.append(tk.IntVar())
-                ttk.Checkbutton(
-                    frame, text=switch, variable=var[-1]
-                ).grid(row=i + 4, column=col, sticky='W', padx=10, pady=5)
-
-        def select_all():
-            for checkbox_var in var:
-                checkbox_var.set(1)
-
-        def unselect_all():
-            for checkbox_var in var:
-                checkbox_var.set(0)
+        # Column headers are drawn on the canvas to stay aligned with
+        # the checkbox columns
+        checks = CheckListCanvas(
+            frame,
+            list(fdr_sw_locname.values()),
+            headers=list(fdr_sw_locname)
+        )
+        checks.grid(columnspan=8, sticky='W', pady=5)
+        var = checks.var
 
         ttk.Button(
-            button_frame, text='Select All', command=select_all
+            button_frame, text='Select All', command=lambda: checks.set_all(1)
         ).pack(side=tk.LEFT, padx=5)
         ttk.Button(
-            button_frame, text='Unselect All', command=unselect_all
+            button_frame,
+            text='Unselect All',
+            command=lambda: checks.set_all(0)
         ).pack(side=tk.LEFT, padx=5)
         ttk.Button(
             button_frame,
@@ -1269,6 +1692,9 @@ class FaultLevelStudy:
             return window_width, window_height
 
         root = tk.Tk()
+        # Keep the window hidden while it is populated so the partial
+        # layout is never drawn
+        root.withdraw()
         root.title("Distribution Fault Study")
         window_width, window_height = _window_dim(
             feeder_list, feeders_devices, region
@@ -1289,26 +1715,24 @@ class FaultLevelStudy:
         )
 
         canvas.pack(expand=True, fill=tk.BOTH)
+        root.deiconify()
         root.mainloop()
 
-        # Build list of selected devices
-        acr_fuse_list = [
-            dev for feeder in fdr_dev_locname
-            for i, dev in enumerate(feeders_devices[feeder])
-            if var[
-                sum(
-                    len(fdr_dev_locname[f])
-                    for f in list(fdr_dev_locname)[
-                        :list(fdr_dev_locname).index(feeder)
-                    ]
-                ) + i
-            ].get() == 1
-        ]
+        # Snapshot checkbox states in one sweep after the dialog closes
+        var_states = [checkbox_var.get() for checkbox_var in var]
+
+        # Checkbox states are laid out feeder by feeder, so each
+        # feeder's first checkbox sits at the running total of the
+        # device counts before it
+        lens = [len(names) for names in fdr_dev_locname.values()]
+        offsets = itertools.accumulate([0] + lens[:-1])
+        off_by_feeder = dict(zip(fdr_dev_locname, offsets))
 
+        # Collect each feeder's selected devices in a single pass
         feeders_relays = {
             feeder: [
-                switch for switch in switches
-                if switch in acr_fuse_list
+                switch for i, switch in enumerate(switches)
+                if var_states[off_by_feeder[feeder] + i] == 1
             ]
             for feeder, switches in feeders_devices.items()
         }
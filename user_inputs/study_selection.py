@@ -20,8 +20,8 @@ Additional Options (with 'all relays' only):
 
 Functions:
     get_study_selections: Main entry point for study selection dialog.
+    selected_studies: Map the dialog's final state to study selections.
     exit_script: Clean exit handler for the GUI.
-    no_study_selected: Re-prompt handler for empty selections.
 
 Example:
     >>> from user_inputs import study_selection
@@ -33,12 +33,57 @@ Example:
 import sys
 import tkinter as tk
 from tkinter import ttk
-from typing import List
-
-from pf_config import pft
-
-
-def get_study_selections(app: pft.Application) -> List[str]:
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pf_config import pft
+
+# Study type radio buttons: (label, value, grid row, returned study name).
+# Rows 6 and 7 hold the options offered with the all relays study.
+_STUDY_RADIOS = (
+    ("Find PowerFactory Project", "0", 1, "Find PowerFactory Project"),
+    ("Find Feeder Open Points", "1", 2, "Find Feeder Open Points"),
+    (
+        "Fault Level Study (SEQ legacy script)", "2", 3,
+        "Fault Level Study (legacy)"
+    ),
+    (
+        "Fault Level Study (No relays configured in model)", "3", 4,
+        "Fault Level Study (no relays configured in model)"
+    ),
+    (
+        "Fault Level Study (All relays configured in model)", "4", 5,
+        "Fault Level Study (all relays configured in model)"
+    ),
+    ("Update TOC Plot Curve Labels", "5", 8, "Update TOC Plot Curve Labels"),
+)
+
+# Radio button value to the study name returned for it.
+_STUDY_MAPPING = {value: study for _, value, _, study in _STUDY_RADIOS}
+
+# Radio button value of the all relays study, the only study offering
+# the additional options below.
+_ALL_RELAYS_VALUE = "4"
+
+# Additional options offered with the all relays study, in grid row
+# order from row 6.
+_EXTRA_OPTIONS = (
+    "Conductor Damage Assessment",
+    "Protection Relay Coordination Plot",
+)
+
+# Fonts of the dialog heading and information panel text.
+_HEADING_FONT = 'Helvetica 14 bold'
+_INFO_FONT = ('Helvetica', 9)
+
+# Text shown in the dialog's information panel.
+_INFO_TEXT = (
+    "At script completion, the location of saved study results files\n"
+    "will be displayed in the PowerFactory output window."
+)
+
+
+def get_study_selections(app: "pft.Application") -> List[str]:
     """
     Display study selection dialog and collect user choices.
 
@@ -66,7 +111,7 @@ def get_study_selections(app: pft.Application) -> List[str]:
             - "Conductor Damage Assessment"
             - "Protection Relay Coordination Plot"
 
-        Returns empty list via recursive call if no selection made.
+        The dialog stays open until a study type is selected.
 
     Example:
         >>> selections = get_study_selections(app)
@@ -75,173 +120,162 @@ def get_study_selections(app: pft.Application) -> List[str]:
          'Conductor Damage Assessment']
     """
     root = tk.Tk()
+    # Build the dialog unmapped; it is shown once fully laid out
+    root.withdraw()
     root.title("Protection Assessment")
     root.geometry("+800+200")
 
     selection = tk.StringVar()
     selection.set('var')
 
-    conductor_damage_var = tk.BooleanVar(value=False)
-    coordination_plot_var = tk.BooleanVar(value=False)
-
     ttk.Label(
         root,
         text="Select study to undertake:",
-        font='Helvetica 14 bold'
+        font=_HEADING_FONT
     ).grid(row=0, columnspan=3, sticky="w", padx=5, pady=5)
 
-    tk.Radiobutton(
-        root,
-        text="Find PowerFactory Project",
-        value="0",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=1, column=0, sticky="w", padx=30, pady=5)
-
-    tk.Radiobutton(
-        root,
-        text="Find Feeder Open Points",
-        value="1",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=2, column=0, sticky="w", padx=30, pady=5)
-
-    tk.Radiobutton(
-        root,
-        text="Fault Level Study (SEQ legacy script)",
-        value="2",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=3, column=0, sticky="w", padx=30, pady=5)
-
-    tk.Radiobutton(
-        root,
-        text="Fault Level Study (No relays configured in model)",
-        value="3",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=4, column=0, sticky="w", padx=30, pady=5)
-
-    tk.Radiobutton(
-        root,
-        text="Fault Level Study (All relays configured in model)",
-        value="4",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=5, column=0, sticky="w", padx=30, pady=5)
-
-    conductor_damage_cb = tk.Checkbutton(
-        root,
-        text="Conductor Damage Assessment",
-        variable=conductor_damage_var,
-        state='disabled'
-    )
-    conductor_damage_cb.grid(row=6, column=0, sticky="w", padx=50, pady=2)
-
-    coordination_plot_cb = tk.Checkbutton(
-        root,
-        text="Protection Relay Coordination Plot",
-        variable=coordination_plot_var,
-        state='disabled'
-    )
-    coordination_plot_cb.grid(row=7, column=0, sticky="w", padx=50, pady=2)
-
-    tk.Radiobutton(
-        root,
-        text="Update TOC Plot Curve Labels",
-        value="5",
-        variable=selection,
-        command=lambda: on_radio_change()
-    ).grid(row=8, column=0, sticky="w", padx=30, pady=5)
-
-    def on_radio_change():
+    for text, value, row, _ in _STUDY_RADIOS:
+        ttk.Radiobutton(
+            root, text=text, value=value, variable=selection
+        ).grid(row=row, column=0, sticky="w", padx=30, pady=5)
+
+    # Option variables are only created if the all relays study is
+    # picked; until then the checkboxes stay disabled and unticked
+    option_vars = [None] * len(_EXTRA_OPTIONS)
+    option_cbs = []
+    for row, text in enumerate(_EXTRA_OPTIONS, start=6):
+        option_cb = ttk.Checkbutton(root, text=text)
+        option_cb.state(['disabled', '!alternate'])
+        option_cb.grid(row=row, column=0, sticky="w", padx=50, pady=2)
+        option_cbs.append(option_cb)
+
+    # Enabled state last applied to the option checkboxes
+    options_enabled = False
+
+    def on_radio_change(*_):
         """Enable/disable checkboxes based on radio button selection."""
-        if selection.get() == "4":
-            conductor_damage_cb.config(state='normal')
-            coordination_plot_cb.config(state='normal')
-        else:
-            conductor_damage_var.set(False)
-            coordination_plot_var.set(False)
-            conductor_damage_cb.config(state='disabled')
-            coordination_plot_cb.config(state='disabled')
+        nonlocal options_enabled
+        enabled = selection.get() == _ALL_RELAYS_VALUE
+        # Moving between two studies on the same side needs no update
+        if enabled == options_enabled:
+            return
+        options_enabled = enabled
+        flags = ['!disabled'] if enabled else ['disabled']
+        for i, option_cb in enumerate(option_cbs):
+            if enabled and option_vars[i] is None:
+                option_vars[i] = tk.BooleanVar(value=False)
+                option_cb.configure(variable=option_vars[i])
+            elif not enabled and option_vars[i] is not None:
+                option_vars[i].set(False)
+            option_cb.state(flags)
+
+    # One trace on the shared variable replaces a command per radio button
+    selection.trace_add('write', on_radio_change)
 
     info_frame = ttk.LabelFrame(root, text="Information", padding=(10, 5))
     info_frame.grid(row=9, column=0, columnspan=3, sticky="ew", padx=10, pady=10)
 
-    info_text = (
-        "At script completion, the location of saved study results files\n"
-        "will be displayed in the PowerFactory output window."
-    )
-    ttk.Label(info_frame, text=info_text, font=('Helvetica', 9)).pack(
+    ttk.Label(info_frame, text=_INFO_TEXT, font=_INFO_FONT).pack(
         anchor="w"
     )
 
-    ttk.Button(
-        root, text='Okay', command=lambda: root.destroy()
-    ).grid(row=10, column=0, sticky="w", padx=5, pady=5)
+    status_var = tk.StringVar()
+    ttk.Label(root, textvariable=status_var, foreground="red").grid(
+        row=11, column=0, columnspan=3, sticky="w", padx=5, pady=2
+    )
+
+    # Filled in by try_ok before the window is destroyed
+    result = []
+
+    def try_ok():
+        """Record the selections and close once a study is selected."""
+        sel = selection.get()
+        if sel == 'var':
+            app.PrintPlain("Please select a study to continue")
+            status_var.set("Please select a study to continue")
+            return
+        options_ticked = [
+            option_var is not None and option_var.get()
+            for option_var in option_vars
+        ]
+        result.extend(selected_studies(sel, options_ticked))
+        root.destroy()
+
+    ok_button = ttk.Button(root, text='Okay', command=try_ok)
+    ok_button.grid(row=10, column=0, sticky="w", padx=5, pady=5)
+
+    # Set by on_exit so the script is ended once the dialog has closed
+    user_exited = False
+
+    def on_exit():
+        """Record the exit, then close the dialog."""
+        nonlocal user_exited
+        user_exited = True
+        exit_script(root, app)
 
     ttk.Button(
-        root, text='Exit', command=lambda: exit_script(root, app)
+        root, text='Exit', command=on_exit
     ).grid(row=10, column=1, sticky="w", padx=5, pady=5)
 
-    root.mainloop()
+    # Return and Escape act as Okay and Exit without reaching for the mouse
+    root.bind("<Return>", lambda _event: try_ok())
+    root.bind("<Escape>", lambda _event: on_exit())
+    ok_button.focus_set()
 
-    study_mapping = {
-        "0": "Find PowerFactory Project",
-        "1": "Find Feeder Open Points",
-        "2": "Fault Level Study (legacy)",
-        "3": "Fault Level Study (no relays configured in model)",
-        "4": "Fault Level Study (all relays configured in model)",
-        "5": "Update TOC Plot Curve Labels"
-    }
+    # Closing the window counts as Okay, so it is validated the same way
+    root.protocol("WM_DELETE_WINDOW", try_ok)
 
-    result = []
+    root.deiconify()
+    # The dialog is modal; wait only until its window is destroyed
+    root.wait_window(root)
 
-    if selection.get() != 'var':
-        study_name = study_mapping.get(selection.get())
-        if study_name:
-            result.append(study_name)
-
-        if selection.get() == "4":
-            if conductor_damage_var.get():
-                result.append("Conductor Damage Assessment")
-            if coordination_plot_var.get():
-                result.append("Protection Relay Coordination Plot")
-    else:
-        result = no_study_selected(app)
+    # Exit only closes the window; end the script from here so
+    # SystemExit is not raised inside a Tk callback
+    if user_exited:
+        sys.exit(0)
 
     return result
 
 
-def exit_script(root: tk.Tk, app: pft.Application) -> None:
+def selected_studies(sel: str, options_ticked: List[bool]) -> List[str]:
     """
-    Clean exit handler for the study selection dialog.
+    Translate the dialog's final state into the study selections.
 
-    Prints termination message to PowerFactory output, destroys
-    the dialog window, and exits the script.
+    Kept free of tkinter so the selection rules can be exercised
+    without a display.
 
     Args:
-        root: The tkinter root window to destroy.
-        app: PowerFactory application instance for output messaging.
+        sel: Value of the selected study radio button.
+        options_ticked: Tick state of each additional option, in
+            _EXTRA_OPTIONS order.
+
+    Returns:
+        List with the selected study type, followed by any ticked
+        additional options if the all relays study was selected.
     """
-    app.PrintPlain("User terminated script.")
-    root.destroy()
-    sys.exit(0)
+    result = [_STUDY_MAPPING[sel]]
+
+    if sel == _ALL_RELAYS_VALUE:
+        result.extend(
+            option for option, ticked in zip(_EXTRA_OPTIONS, options_ticked)
+            if ticked
+        )
+
+    return result
 
 
-def no_study_selected(app: pft.Application) -> List[str]:
+def exit_script(root: tk.Tk, app: "pft.Application") -> None:
     """
-    Handle case when user closes dialog without selecting a study.
+    Clean exit handler for the study selection dialog.
 
-    Prints a prompt message and recursively calls the selection
-    dialog to ensure the user makes a selection.
+    Prints termination message to PowerFactory output and destroys
+    the root window. The caller records the exit and ends the script
+    once the dialog's wait returns.
 
     Args:
+        root: The tkinter root window of the dialog.
         app: PowerFactory application instance for output messaging.
-
-    Returns:
-        List of selected study options from the re-prompted dialog.
     """
-    app.PrintPlain("Please select a study to continue")
-    study = get_study_selections(app)
-    return study
\ No newline at end of file
+    app.PrintPlain("User terminated script.")
+    root.destroy()
+